@@ -1,7 +1,14 @@
-from fastapi import FastAPI, HTTPException, status
+from fastapi import FastAPI, HTTPException, Request, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
+from starlette.exceptions import HTTPException as StarletteHTTPException
 import uvicorn
-import base64
-from typing import Dict, List
+from contextlib import asynccontextmanager
+from urllib.parse import parse_qs, quote
+from typing import Any, Dict, List, Literal, Optional, Tuple, Union
 
 # Import session manager
 import session_manager
@@ -9,22 +16,118 @@ from models import (
     StartSessionRequest, StartSessionResponse, CloseSessionRequest,
     GotoRequest, ClickRequest, HoverRequest, FillRequest, TypeRequest,
     PressRequest, CheckRequest, UncheckRequest, SelectOptionRequest,
-    SuccessResponse, ErrorResponse, StructuredLocator
+    SuccessResponse, ErrorResponse, StructuredLocator, ActionRequest,
+    BatchRequest, BatchResponse
 )
 
+
+def _normalize_locator(locator: Union[str, StructuredLocator]) -> Union[str, Dict[str, str]]:
+    """Convert a request locator into the str/dict form session_manager expects."""
+    cls = locator.__class__
+    if cls is str or cls is dict:
+        return locator
+    return {"role": locator.role, "name": locator.name}
+
+
+# Screenshot transport for action responses: base64 inside JSON, or the raw
+# image as the body with the outcome carried in X-Action-* headers
+ScreenshotEncoding = Literal["base64", "raw"]
+
+# OpenAPI description shared by all /action/* routes
+ACTION_RESPONSES = {
+    200: {"model": SuccessResponse, "content": {"image/jpeg": {}, "image/png": {}}},
+    500: {"model": ErrorResponse}
+}
+
+
+async def _action_body(request: Union[ActionRequest, GotoRequest], success: bool,
+                       screenshot: Optional[bytes], error: str) -> Dict[str, Any]:
+    """JSON body of an action result: SuccessResponse or ErrorResponse shaped."""
+    encoded = await session_manager.encode_screenshot(request.sessionId, screenshot)
+    if success:
+        return {"status": "success", "screenshot": encoded}
+    return {"status": "error", "error": error, "screenshot": encoded}
+
+
+# Printable ASCII left as-is in X-Action-Error; everything else, including
+# "%", is percent-encoded as UTF-8
+_HEADER_SAFE = "".join(chr(c) for c in range(0x20, 0x7f) if chr(c) != "%")
+
+
+async def _action_response(request: Union[ActionRequest, GotoRequest], success: bool, screenshot: Optional[bytes], error: str,
+                           encode: ScreenshotEncoding = "base64") -> Response:
+    """
+    Build an action response directly, bypassing response-model validation.
+    
+    With encode="base64" the JSON body matches SuccessResponse on success and
+    ErrorResponse otherwise. With encode="raw" the body is the screenshot
+    itself and no base64 work is done.
+    """
+    if encode == "raw":
+        headers = {"X-Action-Status": "success" if success else "error"}
+        if not success:
+            # Messages can echo client input (e.g. the goto URL); control
+            # characters would make the header invalid mid-response
+            headers["X-Action-Error"] = quote(error, safe=_HEADER_SAFE)
+        return Response(content=screenshot or b"", media_type=f"image/{request.image_format}", headers=headers)
+    
+    return ORJSONResponse(await _action_body(request, success, screenshot, error))
+
+
+class ScreenshotGZipMiddleware(GZipMiddleware):
+    """
+    GZip middleware that leaves encode=raw responses alone.
+    
+    Base64 screenshots in JSON compress well, but a raw JPEG body is already
+    compressed and would only cost CPU.
+    """
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope.get("query_string"):
+            query = parse_qs(scope["query_string"].decode("latin-1"))
+            if query.get("encode") == ["raw"]:
+                await self.app(scope, receive, send)
+                return
+        await super().__call__(scope, receive, send)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm the shared browser pool on startup and tear it down on shutdown."""
+    await session_manager.startup()
+    yield
+    await session_manager.shutdown()
+
+
 app = FastAPI(title="Playwright Action API",
-              description="REST API for Playwright browser automation actions")
+              description="REST API for Playwright browser automation actions",
+              default_response_class=ORJSONResponse,
+              lifespan=lifespan)
+app.add_middleware(ScreenshotGZipMiddleware, minimum_size=1024, compresslevel=5)
+
+
+@app.exception_handler(StarletteHTTPException)
+async def http_exception_handler(request: Request, exc: StarletteHTTPException):
+    """Serialize HTTP errors with orjson, like every other response."""
+    return ORJSONResponse({"detail": exc.detail}, status_code=exc.status_code, headers=exc.headers)
+
+
+@app.exception_handler(RequestValidationError)
+async def validation_exception_handler(request: Request, exc: RequestValidationError):
+    """Serialize request validation errors with orjson, in FastAPI's default shape."""
+    return ORJSONResponse({"detail": jsonable_encoder(exc.errors())}, 
+                          status_code=status.HTTP_422_UNPROCESSABLE_ENTITY)
 
 
 @app.get("/")
 async def root():
     """Root endpoint with basic information about the API."""
-    return {
+    return ORJSONResponse({
         "message": "Playwright Action API",
         "docs": "/docs",
         "endpoints": [
             {"path": "/session/start", "method": "POST", "description": "Start a new browser session"},
             {"path": "/session/close", "method": "POST", "description": "Close an active browser session"},
+            {"path": "/session/ready", "method": "GET", "description": "Check whether a session's page is idle"},
             {"path": "/action/goto", "method": "POST", "description": "Navigate to a URL"},
             {"path": "/action/click", "method": "POST", "description": "Click on an element"},
             {"path": "/action/hover", "method": "POST", "description": "Hover over an element"},
@@ -33,17 +136,32 @@ async def root():
             {"path": "/action/press", "method": "POST", "description": "Press a key"},
             {"path": "/action/check", "method": "POST", "description": "Check a checkbox"},
             {"path": "/action/uncheck", "method": "POST", "description": "Uncheck a checkbox"},
-            {"path": "/action/select_option", "method": "POST", "description": "Select an option"}
+            {"path": "/action/select_option", "method": "POST", "description": "Select an option"},
+            {"path": "/action/batch", "method": "POST", "description": "Run several actions in one request"}
+        ],
+        "action_options": [
+            {"name": "screenshot", "in": "body",
+             "description": "Set to false to skip the post-action screenshot. This removes the most expensive "
+                            "step of each action, at the cost of an empty screenshot in the response"},
+            {"name": "image_format", "in": "body", "description": "Screenshot format: 'jpeg' (default) or 'png'"},
+            {"name": "capture_on_miss", "in": "body",
+             "description": "Set to true to still take a screenshot when a structured locator matches no element; "
+                            "by default that error response has a null screenshot"},
+            {"name": "encode", "in": "query",
+             "description": "'base64' (default) for JSON, or 'raw' for the image as the response body"}
         ]
-    }
+    })
 
 
-@app.post("/session/start", response_model=StartSessionResponse, tags=["Session Management"])
+@app.post("/session/start", response_model=None, responses={200: {"model": StartSessionResponse}},
+          tags=["Session Management"])
 async def start_session(request: StartSessionRequest):
     """
     Start a new browser session.
     
-    Creates a new browser instance with the specified configuration.
+    Creates a new browser context with the specified configuration. The
+    session ID is returned right away while the context is created in the
+    background; the first action on the session waits for it to be ready.
     """
     try:
         # Prepare viewport settings if provided
@@ -63,7 +181,7 @@ async def start_session(request: StartSessionRequest):
             viewport=viewport
         )
         
-        return StartSessionResponse(sessionId=session_id)
+        return ORJSONResponse({"sessionId": session_id})
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, 
                             detail=f"Failed to start session: {str(e)}")
@@ -79,7 +197,7 @@ async def close_session(request: CloseSessionRequest):
         if not success:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, 
                                 detail=f"Session not found: {request.sessionId}")
-        return {"status": "success", "message": f"Session {request.sessionId} closed successfully"}
+        return ORJSONResponse({"status": "success", "message": f"Session {request.sessionId} closed successfully"})
     except Exception as e:
         if isinstance(e, HTTPException):
             raise e
@@ -87,277 +205,344 @@ async def close_session(request: CloseSessionRequest):
                             detail=f"Failed to close session: {str(e)}")
 
 
-@app.post("/action/goto", response_model=SuccessResponse, responses={500: {"model": ErrorResponse}}, tags=["Actions"])
-async def goto(request: GotoRequest):
+@app.get("/session/ready", tags=["Session Management"])
+async def session_ready(sessionId: str):
+    """
+    Report whether a session is ready for the next action.
+    
+    Returns 200 once the session has launched and its page has finished
+    loading, and 503 while it is still starting or navigating, so clients
+    can poll this instead of sleeping.
+    """
+    try:
+        idle = await session_manager.is_page_idle(sessionId)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, 
+                            detail=f"Failed to check session: {str(e)}")
+    
+    if idle:
+        return ORJSONResponse({"status": "ready"})
+    return ORJSONResponse({"status": "busy"}, status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
+
+
+async def _run_goto(request: GotoRequest) -> Tuple[bool, Optional[bytes], str]:
+    """Execute the goto action; returns (success, screenshot, error message)."""
+    success, screenshot = await session_manager.execute_action(
+        session_id=request.sessionId,
+        action="goto",
+        image_format=request.image_format,
+        take_screenshot=request.screenshot,
+        locator=None,
+        url=request.url
+    )
+    return success, screenshot, f"Failed to navigate to {request.url}"
+
+
+@app.post("/action/goto", response_model=None, responses=ACTION_RESPONSES, tags=["Actions"])
+async def goto(request: GotoRequest, encode: ScreenshotEncoding = "base64"):
     """
     Navigate to a URL in the specified session.
     """
     try:
-        success, screenshot = await session_manager.execute_action(
-            session_id=request.sessionId,
-            action="goto",
-            locator=None,
-            url=request.url
-        )
-        
-        if success:
-            return SuccessResponse(screenshot=base64.b64encode(screenshot).decode())
-        else:
-            return ErrorResponse(status="error", error=f"Failed to navigate to {request.url}", 
-                                 screenshot=base64.b64encode(screenshot).decode())
+        success, screenshot, error = await _run_goto(request)
+        return await _action_response(request, success, screenshot, error, encode)
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, 
                             detail=f"Error executing goto action: {str(e)}")
 
 
-@app.post("/action/click", response_model=SuccessResponse, responses={500: {"model": ErrorResponse}}, tags=["Actions"])
-async def click(request: ClickRequest):
+async def _run_click(request: ClickRequest) -> Tuple[bool, Optional[bytes], str]:
+    """Execute the click action; returns (success, screenshot, error message)."""
+    kwargs = {
+        "force": request.force,
+        "button": request.button
+    }
+    if request.delay is not None:
+        kwargs["delay"] = request.delay
+    
+    success, screenshot = await session_manager.execute_action(
+        session_id=request.sessionId,
+        action="click",
+        image_format=request.image_format,
+        take_screenshot=request.screenshot,
+        capture_on_miss=request.capture_on_miss,
+        locator=_normalize_locator(request.locator),
+        **kwargs
+    )
+    return success, screenshot, "Failed to click element"
+
+
+@app.post("/action/click", response_model=None, responses=ACTION_RESPONSES, tags=["Actions"])
+async def click(request: ClickRequest, encode: ScreenshotEncoding = "base64"):
     """
     Click on an element identified by the locator.
     """
     try:
-        kwargs = {
-            "force": request.force,
-            "button": request.button
-        }
-        if request.delay is not None:
-            kwargs["delay"] = request.delay
-        
-        # Convert Pydantic model to dict if it's a structured locator
-        locator = request.locator
-        if not isinstance(locator, str) and not isinstance(locator, dict):
-            # Convert to a dict explicitly if it's a pydantic model
-            locator = {"role": locator.role, "name": locator.name}
-            
-        success, screenshot = await session_manager.execute_action(
-            session_id=request.sessionId,
-            action="click",
-            locator=locator,
-            **kwargs
-        )
-        
-        if success:
-            return SuccessResponse(screenshot=base64.b64encode(screenshot).decode())
-        else:
-            return ErrorResponse(status="error", error=f"Failed to click element", 
-                                 screenshot=base64.b64encode(screenshot).decode())
+        success, screenshot, error = await _run_click(request)
+        return await _action_response(request, success, screenshot, error, encode)
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, 
                             detail=f"Error executing click action: {str(e)}")
 
 
-@app.post("/action/hover", response_model=SuccessResponse, responses={500: {"model": ErrorResponse}}, tags=["Actions"])
-async def hover(request: HoverRequest):
+async def _run_hover(request: HoverRequest) -> Tuple[bool, Optional[bytes], str]:
+    """Execute the hover action; returns (success, screenshot, error message)."""
+    kwargs = {"force": request.force}
+    if request.position is not None:
+        kwargs["position"] = request.position
+    
+    success, screenshot = await session_manager.execute_action(
+        session_id=request.sessionId,
+        action="hover",
+        image_format=request.image_format,
+        take_screenshot=request.screenshot,
+        capture_on_miss=request.capture_on_miss,
+        locator=_normalize_locator(request.locator),
+        **kwargs
+    )
+    return success, screenshot, "Failed to hover over element"
+
+
+@app.post("/action/hover", response_model=None, responses=ACTION_RESPONSES, tags=["Actions"])
+async def hover(request: HoverRequest, encode: ScreenshotEncoding = "base64"):
     """
     Hover over an element identified by the locator.
     """
     try:
-        kwargs = {"force": request.force}
-        if request.position is not None:
-            kwargs["position"] = request.position
-        
-        # Convert Pydantic model to dict if it's a structured locator
-        locator = request.locator
-        if not isinstance(locator, str) and not isinstance(locator, dict):
-            # Convert to a dict explicitly if it's a pydantic model
-            locator = {"role": locator.role, "name": locator.name}
-            
-        success, screenshot = await session_manager.execute_action(
-            session_id=request.sessionId,
-            action="hover",
-            locator=locator,
-            **kwargs
-        )
-        
-        if success:
-            return SuccessResponse(screenshot=base64.b64encode(screenshot).decode())
-        else:
-            return ErrorResponse(status="error", error=f"Failed to hover over element", 
-                                 screenshot=base64.b64encode(screenshot).decode())
+        success, screenshot, error = await _run_hover(request)
+        return await _action_response(request, success, screenshot, error, encode)
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, 
                             detail=f"Error executing hover action: {str(e)}")
 
 
-@app.post("/action/fill", response_model=SuccessResponse, responses={500: {"model": ErrorResponse}}, tags=["Actions"])
-async def fill(request: FillRequest):
+async def _run_fill(request: FillRequest) -> Tuple[bool, Optional[bytes], str]:
+    """Execute the fill action; returns (success, screenshot, error message)."""
+    success, screenshot = await session_manager.execute_action(
+        session_id=request.sessionId,
+        action="fill",
+        image_format=request.image_format,
+        take_screenshot=request.screenshot,
+        capture_on_miss=request.capture_on_miss,
+        locator=_normalize_locator(request.locator),
+        value=request.value,
+        force=request.force
+    )
+    return success, screenshot, "Failed to fill element"
+
+
+@app.post("/action/fill", response_model=None, responses=ACTION_RESPONSES, tags=["Actions"])
+async def fill(request: FillRequest, encode: ScreenshotEncoding = "base64"):
     """
     Fill a form field with the provided value.
     """
     try:
-        # Convert Pydantic model to dict if it's a structured locator
-        locator = request.locator
-        if not isinstance(locator, str) and not isinstance(locator, dict):
-            # Convert to a dict explicitly if it's a pydantic model
-            locator = {"role": locator.role, "name": locator.name}
-            
-        success, screenshot = await session_manager.execute_action(
-            session_id=request.sessionId,
-            action="fill",
-            locator=locator,
-            value=request.value,
-            force=request.force
-        )
-        
-        if success:
-            return SuccessResponse(screenshot=base64.b64encode(screenshot).decode())
-        else:
-            return ErrorResponse(status="error", error=f"Failed to fill element", 
-                                 screenshot=base64.b64encode(screenshot).decode())
+        success, screenshot, error = await _run_fill(request)
+        return await _action_response(request, success, screenshot, error, encode)
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, 
                             detail=f"Error executing fill action: {str(e)}")
 
 
-@app.post("/action/type", response_model=SuccessResponse, responses={500: {"model": ErrorResponse}}, tags=["Actions"])
-async def type_text(request: TypeRequest):
+async def _run_type(request: TypeRequest) -> Tuple[bool, Optional[bytes], str]:
+    """Execute the type action; returns (success, screenshot, error message)."""
+    kwargs = {}
+    if request.delay is not None:
+        kwargs["delay"] = request.delay
+    
+    success, screenshot = await session_manager.execute_action(
+        session_id=request.sessionId,
+        action="type",
+        image_format=request.image_format,
+        take_screenshot=request.screenshot,
+        capture_on_miss=request.capture_on_miss,
+        locator=_normalize_locator(request.locator),
+        text=request.text,
+        **kwargs
+    )
+    return success, screenshot, "Failed to type text"
+
+
+@app.post("/action/type", response_model=None, responses=ACTION_RESPONSES, tags=["Actions"])
+async def type_text(request: TypeRequest, encode: ScreenshotEncoding = "base64"):
     """
     Type text into an element identified by the locator.
     """
     try:
-        kwargs = {}
-        if request.delay is not None:
-            kwargs["delay"] = request.delay
-        
-        # Convert Pydantic model to dict if it's a structured locator
-        locator = request.locator
-        if not isinstance(locator, str) and not isinstance(locator, dict):
-            # Convert to a dict explicitly if it's a pydantic model
-            locator = {"role": locator.role, "name": locator.name}
-            
-        success, screenshot = await session_manager.execute_action(
-            session_id=request.sessionId,
-            action="type",
-            locator=locator,
-            text=request.text,
-            **kwargs
-        )
-        
-        if success:
-            return SuccessResponse(screenshot=base64.b64encode(screenshot).decode())
-        else:
-            return ErrorResponse(status="error", error=f"Failed to type text", 
-                                 screenshot=base64.b64encode(screenshot).decode())
+        success, screenshot, error = await _run_type(request)
+        return await _action_response(request, success, screenshot, error, encode)
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, 
                             detail=f"Error executing type action: {str(e)}")
 
 
-@app.post("/action/press", response_model=SuccessResponse, responses={500: {"model": ErrorResponse}}, tags=["Actions"])
-async def press(request: PressRequest):
+async def _run_press(request: PressRequest) -> Tuple[bool, Optional[bytes], str]:
+    """Execute the press action; returns (success, screenshot, error message)."""
+    success, screenshot = await session_manager.execute_action(
+        session_id=request.sessionId,
+        action="press",
+        image_format=request.image_format,
+        take_screenshot=request.screenshot,
+        capture_on_miss=request.capture_on_miss,
+        locator=_normalize_locator(request.locator),
+        key=request.key
+    )
+    return success, screenshot, "Failed to press key"
+
+
+@app.post("/action/press", response_model=None, responses=ACTION_RESPONSES, tags=["Actions"])
+async def press(request: PressRequest, encode: ScreenshotEncoding = "base64"):
     """
     Press a key on an element identified by the locator.
     """
     try:
-        # Convert Pydantic model to dict if it's a structured locator
-        locator = request.locator
-        if not isinstance(locator, str) and not isinstance(locator, dict):
-            # Convert to a dict explicitly if it's a pydantic model
-            locator = {"role": locator.role, "name": locator.name}
-            
-        success, screenshot = await session_manager.execute_action(
-            session_id=request.sessionId,
-            action="press",
-            locator=locator,
-            key=request.key
-        )
-        
-        if success:
-            return SuccessResponse(screenshot=base64.b64encode(screenshot).decode())
-        else:
-            return ErrorResponse(status="error", error=f"Failed to press key", 
-                                 screenshot=base64.b64encode(screenshot).decode())
+        success, screenshot, error = await _run_press(request)
+        return await _action_response(request, success, screenshot, error, encode)
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, 
                             detail=f"Error executing press action: {str(e)}")
 
 
-@app.post("/action/check", response_model=SuccessResponse, responses={500: {"model": ErrorResponse}}, tags=["Actions"])
-async def check(request: CheckRequest):
+async def _run_check(request: CheckRequest) -> Tuple[bool, Optional[bytes], str]:
+    """Execute the check action; returns (success, screenshot, error message)."""
+    success, screenshot = await session_manager.execute_action(
+        session_id=request.sessionId,
+        action="check",
+        image_format=request.image_format,
+        take_screenshot=request.screenshot,
+        capture_on_miss=request.capture_on_miss,
+        locator=_normalize_locator(request.locator),
+        force=request.force
+    )
+    return success, screenshot, "Failed to check element"
+
+
+@app.post("/action/check", response_model=None, responses=ACTION_RESPONSES, tags=["Actions"])
+async def check(request: CheckRequest, encode: ScreenshotEncoding = "base64"):
     """
     Check a checkbox identified by the locator.
     """
     try:
-        # Convert Pydantic model to dict if it's a structured locator
-        locator = request.locator
-        if not isinstance(locator, str) and not isinstance(locator, dict):
-            # Convert to a dict explicitly if it's a pydantic model
-            locator = {"role": locator.role, "name": locator.name}
-            
-        success, screenshot = await session_manager.execute_action(
-            session_id=request.sessionId,
-            action="check",
-            locator=locator,
-            force=request.force
-        )
-        
-        if success:
-            return SuccessResponse(screenshot=base64.b64encode(screenshot).decode())
-        else:
-            return ErrorResponse(status="error", error=f"Failed to check element", 
-                                 screenshot=base64.b64encode(screenshot).decode())
+        success, screenshot, error = await _run_check(request)
+        return await _action_response(request, success, screenshot, error, encode)
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, 
                             detail=f"Error executing check action: {str(e)}")
 
 
-@app.post("/action/uncheck", response_model=SuccessResponse, responses={500: {"model": ErrorResponse}}, tags=["Actions"])
-async def uncheck(request: UncheckRequest):
+async def _run_uncheck(request: UncheckRequest) -> Tuple[bool, Optional[bytes], str]:
+    """Execute the uncheck action; returns (success, screenshot, error message)."""
+    success, screenshot = await session_manager.execute_action(
+        session_id=request.sessionId,
+        action="uncheck",
+        image_format=request.image_format,
+        take_screenshot=request.screenshot,
+        capture_on_miss=request.capture_on_miss,
+        locator=_normalize_locator(request.locator),
+        force=request.force
+    )
+    return success, screenshot, "Failed to uncheck element"
+
+
+@app.post("/action/uncheck", response_model=None, responses=ACTION_RESPONSES, tags=["Actions"])
+async def uncheck(request: UncheckRequest, encode: ScreenshotEncoding = "base64"):
     """
     Uncheck a checkbox identified by the locator.
     """
     try:
-        # Convert Pydantic model to dict if it's a structured locator
-        locator = request.locator
-        if not isinstance(locator, str) and not isinstance(locator, dict):
-            # Convert to a dict explicitly if it's a pydantic model
-            locator = {"role": locator.role, "name": locator.name}
-            
-        success, screenshot = await session_manager.execute_action(
-            session_id=request.sessionId,
-            action="uncheck",
-            locator=locator,
-            force=request.force
-        )
-        
-        if success:
-            return SuccessResponse(screenshot=base64.b64encode(screenshot).decode())
-        else:
-            return ErrorResponse(status="error", error=f"Failed to uncheck element", 
-                                 screenshot=base64.b64encode(screenshot).decode())
+        success, screenshot, error = await _run_uncheck(request)
+        return await _action_response(request, success, screenshot, error, encode)
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, 
                             detail=f"Error executing uncheck action: {str(e)}")
 
 
-@app.post("/action/select_option", response_model=SuccessResponse, responses={500: {"model": ErrorResponse}}, tags=["Actions"])
-async def select_option(request: SelectOptionRequest):
+async def _run_select_option(request: SelectOptionRequest) -> Tuple[bool, Optional[bytes], str]:
+    """Execute the select_option action; returns (success, screenshot, error message)."""
+    success, screenshot = await session_manager.execute_action(
+        session_id=request.sessionId,
+        action="select_option",
+        image_format=request.image_format,
+        take_screenshot=request.screenshot,
+        capture_on_miss=request.capture_on_miss,
+        locator=_normalize_locator(request.locator),
+        values=request.values
+    )
+    return success, screenshot, "Failed to select option"
+
+
+@app.post("/action/select_option", response_model=None, responses=ACTION_RESPONSES, tags=["Actions"])
+async def select_option(request: SelectOptionRequest, encode: ScreenshotEncoding = "base64"):
     """
     Select options in a select element identified by the locator.
     """
     try:
-        # Convert Pydantic model to dict if it's a structured locator
-        locator = request.locator
-        if not isinstance(locator, str) and not isinstance(locator, dict):
-            # Convert to a dict explicitly if it's a pydantic model
-            locator = {"role": locator.role, "name": locator.name}
-            
-        success, screenshot = await session_manager.execute_action(
-            session_id=request.sessionId,
-            action="select_option",
-            locator=locator,
-            values=request.values
-        )
-        
-        if success:
-            return SuccessResponse(screenshot=base64.b64encode(screenshot).decode())
-        else:
-            return ErrorResponse(status="error", error=f"Failed to select option", 
-                                 screenshot=base64.b64encode(screenshot).decode())
+        success, screenshot, error = await _run_select_option(request)
+        return await _action_response(request, success, screenshot, error, encode)
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, 
                             detail=f"Error executing select_option action: {str(e)}")
 
 
+# Actions available to /action/batch: op -> (request model, runner)
+_BATCH_OPS = {
+    "goto": (GotoRequest, _run_goto),
+    "click": (ClickRequest, _run_click),
+    "hover": (HoverRequest, _run_hover),
+    "fill": (FillRequest, _run_fill),
+    "type": (TypeRequest, _run_type),
+    "press": (PressRequest, _run_press),
+    "check": (CheckRequest, _run_check),
+    "uncheck": (UncheckRequest, _run_uncheck),
+    "select_option": (SelectOptionRequest, _run_select_option),
+}
+
+
+@app.post("/action/batch", response_model=None,
+          responses={200: {"model": BatchResponse}, 500: {"model": ErrorResponse}}, tags=["Actions"])
+async def batch(request: BatchRequest):
+    """
+    Run several actions on one session in a single request.
+    
+    Each action is an object with an "op" (goto, click, hover, fill, type,
+    press, check, uncheck, select_option) and the same fields as that
+    action's own endpoint, without sessionId. Actions run in order and each
+    result has the same shape as the single-action response.
+    """
+    # Validate every step before running any of them
+    steps = []
+    for index, action in enumerate(request.actions):
+        op = action.get("op")
+        # A list or object op is unhashable and can't be looked up
+        if not isinstance(op, str) or op not in _BATCH_OPS:
+            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, 
+                                detail=f"Unsupported op in action {index}: {op}")
+        model, runner = _BATCH_OPS[op]
+        try:
+            steps.append((runner, model.model_validate({**action, "sessionId": request.sessionId})))
+        except ValidationError as e:
+            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, 
+                                detail=f"Invalid action {index} ({op}): {str(e)}")
+    
+    try:
+        results = []
+        all_succeeded = True
+        for runner, step in steps:
+            success, screenshot, error = await runner(step)
+            results.append(await _action_body(step, success, screenshot, error))
+            if not success:
+                all_succeeded = False
+                if request.stop_on_error:
+                    break
+        
+        return ORJSONResponse({"status": "success" if all_succeeded else "error", "results": results})
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, 
+                            detail=f"Error executing batch action: {str(e)}")
+
+
 if __name__ == "__main__":
-    uvicorn.run("app:app", host="0.0.0.0", port=8000, reload=True) 
\ No newline at end of file
+    # Sessions live in this process's memory, so keep a single worker.
+    uvicorn.run("app:app", host="0.0.0.0", port=8000, loop="uvloop", http="httptools", reload=False)
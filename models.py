@@ -30,12 +30,25 @@ class StructuredLocator(BaseModel):
     name: str
 
 
-class ActionRequest(BaseModel):
+class ScreenshotOptions(BaseModel):
+    screenshot: bool = Field(True, description="Take a screenshot after the action; false returns an empty screenshot but is much faster")
+    image_format: str = Field('jpeg', description="Screenshot format: 'jpeg' or 'png'")
+    
+    @field_validator('image_format')
+    @classmethod
+    def validate_image_format(cls, v):
+        if v.lower() not in ['jpeg', 'png']:
+            raise ValueError(f'Image format must be one of: jpeg, png. Got: {v}')
+        return v.lower()
+
+
+class ActionRequest(ScreenshotOptions):
     sessionId: str
     locator: Union[str, StructuredLocator]
+    capture_on_miss: bool = Field(False, description="Take a screenshot even when a structured locator matches no element; otherwise the screenshot is null")
 
 
-class GotoRequest(BaseModel):
+class GotoRequest(ScreenshotOptions):
     sessionId: str
     url: str
 
@@ -86,10 +99,22 @@ class SelectOptionRequest(ActionRequest):
 
 class SuccessResponse(BaseModel):
     status: str = "success"
-    screenshot: str = Field(..., description="Base64-encoded PNG screenshot")
+    screenshot: str = Field(..., description="Base64-encoded screenshot (JPEG unless image_format is png)")
 
 
 class ErrorResponse(BaseModel):
     status: str = "error"
     error: str
-    screenshot: Optional[str] = Field(None, description="Base64-encoded PNG screenshot") 
\ No newline at end of file
+    screenshot: Optional[str] = Field(None, description="Base64-encoded screenshot (JPEG unless image_format is png)")
+
+
+class BatchRequest(BaseModel):
+    sessionId: str
+    actions: List[Dict[str, Any]] = Field(..., description="Actions to run in order; each has an 'op' "
+                                                             "(e.g. 'goto', 'fill') plus that action's parameters")
+    stop_on_error: bool = Field(True, description="Skip the remaining actions after the first failure")
+
+
+class BatchResponse(BaseModel):
+    status: str = Field(..., description="'success' if every action succeeded, otherwise 'error'")
+    results: List[Union[SuccessResponse, ErrorResponse]] = Field(..., description="One result per action that was run, in order")
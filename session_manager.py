@@ -1,18 +1,383 @@
 import asyncio
+import heapq
+import logging
+import os
+import time
 import uuid
-import base64
-from typing import Dict, Optional, Any, Tuple
-from playwright.async_api import async_playwright, Playwright, Browser, BrowserContext, Page
+import pybase64
+import xxhash
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Awaitable, Callable, Coroutine, Dict, ItemsView, List, Optional, Any, Set, Tuple
+from playwright.async_api import async_playwright, Playwright, Browser, BrowserContext, Locator, Page
+from playwright.async_api import Error as PlaywrightError
 
-# Dictionary to store active sessions
-# Format: {session_id: {playwright, browser, context, page}}
-sessions: Dict[str, Dict[str, Any]] = {}
+# Use libuv's event loop for every asyncio entrypoint that imports this module
+# (the app, test harnesses, scripts), not just when uvicorn is told to
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
+logger = logging.getLogger(__name__)
+
+# Sessions idle for longer than this (in seconds) are closed automatically;
+# set SESSION_TTL in the environment to change it
+SESSION_TTL = float(os.getenv("SESSION_TTL", str(30 * 60)))
+
+
+@dataclass(slots=True)
+class Session:
+    """State of one browser session."""
+    browser_type: str
+    # Set by the background launch once ready is set (and error is None)
+    browser: Optional[Browser] = None
+    context: Optional[BrowserContext] = None
+    page: Optional[Page] = None
+    ready: asyncio.Event = field(default_factory=asyncio.Event)
+    error: Optional[str] = None
+    # (len, xxh3_64) of screenshot bytes -> base64 string, in LRU order
+    b64_cache: Dict[Tuple[int, int], str] = field(default_factory=dict)
+    # (url, role, name) -> index of the structured-locator strategy that matched
+    locator_cache: Dict[Tuple[str, str, str], int] = field(default_factory=dict)
+    # True from the start of a main-frame navigation until the new document
+    # loads; only maintained once navigation_tracked is set
+    navigating: bool = False
+    # Whether the page has _track_navigation's listeners (first /session/ready)
+    navigation_tracked: bool = False
+
+
+class SessionStore:
+    """
+    Registry of active sessions with idle expiry.
+    
+    Deadlines are kept in a min-heap of (expires_at, session_id). Touching a
+    session only updates its deadline in a dict; the stale heap entry is
+    pushed back with the new deadline when the GC task reaches it, so lookups
+    stay O(1) and the heap holds at most one entry per session.
+    """
+    
+    def __init__(self, ttl: float = SESSION_TTL,
+                 on_expire: Optional[Callable[[Session], Awaitable[None]]] = None):
+        self._ttl = ttl
+        self._on_expire = on_expire
+        self._d: Dict[str, Session] = {}
+        self._deadlines: Dict[str, float] = {}
+        self._ttls: Dict[str, float] = {}
+        self._exp: List[Tuple[float, str]] = []
+        self._lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._gc_task: Optional[asyncio.Task] = None
+    
+    async def put(self, session_id: str, session: Session, ttl: Optional[float] = None) -> None:
+        """Register a session, expiring after ttl seconds of inactivity."""
+        ttl = self._ttl if ttl is None else ttl
+        async with self._lock:
+            self._d[session_id] = session
+            self._ttls[session_id] = ttl
+            self._deadlines[session_id] = time.monotonic() + ttl
+            heapq.heappush(self._exp, (self._deadlines[session_id], session_id))
+        self._wakeup.set()
+    
+    async def get(self, session_id: str) -> Optional[Session]:
+        """Return a session and push back its expiry, or None if unknown."""
+        async with self._lock:
+            session = self._d.get(session_id)
+            if session is not None:
+                self._deadlines[session_id] = time.monotonic() + self._ttls[session_id]
+            return session
+    
+    async def pop(self, session_id: str) -> Optional[Session]:
+        """Remove and return a session, or None if unknown."""
+        async with self._lock:
+            self._deadlines.pop(session_id, None)
+            self._ttls.pop(session_id, None)
+            return self._d.pop(session_id, None)
+    
+    def peek(self, session_id: str) -> Optional[Session]:
+        """Return a session without touching its expiry."""
+        return self._d.get(session_id)
+    
+    def items(self) -> ItemsView[str, Session]:
+        """View of (session_id, session) pairs."""
+        return self._d.items()
+    
+    def __contains__(self, session_id: str) -> bool:
+        return session_id in self._d
+    
+    def __len__(self) -> int:
+        return len(self._d)
+    
+    def start(self) -> None:
+        """Start the background expiry task."""
+        if self._gc_task is None:
+            self._gc_task = asyncio.create_task(self._gc())
+    
+    async def stop(self) -> None:
+        """Cancel the background expiry task."""
+        if self._gc_task is not None:
+            self._gc_task.cancel()
+            try:
+                await self._gc_task
+            except asyncio.CancelledError:
+                pass
+            self._gc_task = None
+    
+    async def _gc(self) -> None:
+        while True:
+            self._wakeup.clear()
+            if not self._exp:
+                await self._wakeup.wait()
+                continue
+            
+            expires_at, session_id = self._exp[0]
+            delay = expires_at - time.monotonic()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            
+            heapq.heappop(self._exp)
+            deadline = self._deadlines.get(session_id)
+            if deadline is None:
+                # Already closed
+                continue
+            if deadline > expires_at:
+                # Touched since this entry was pushed
+                heapq.heappush(self._exp, (deadline, session_id))
+                continue
+            
+            session = await self.pop(session_id)
+            if session is not None and self._on_expire is not None:
+                try:
+                    await self._on_expire(session)
+                except Exception:
+                    # The page or context may already be gone
+                    pass
+
+
+async def _close_session_resources(session: Session) -> None:
+    """Close a session's page and context; the browser belongs to the pool."""
+    # Let a launch that is still in flight finish so nothing is leaked
+    await session.ready.wait()
+    if session.page is not None:
+        await session.page.close()
+    if session.context is not None:
+        await session.context.close()
+
+
+# Store of active sessions, keyed by session ID
+sessions = SessionStore(on_expire=_close_session_resources)
+
+# JPEG quality (0-100) for action screenshots
+SCREENSHOT_QUALITY = int(os.getenv("SCREENSHOT_Q", "60"))
+
+# Number of encoded screenshots remembered per session
+B64_CACHE_SIZE = 32
+
+# Browsers launched at startup so the first session doesn't pay for it
+PREWARM_BROWSERS: Tuple[Tuple[str, bool], ...] = (("chromium", True),)
+
+# Shared Playwright driver and browser pool, keyed by (browser_type, headless).
+# Sessions only get their own context and page; pooled browsers stay up until
+# shutdown() so they are never torn down under a live session.
+_playwright: Optional[Playwright] = None
+_browsers: Dict[Tuple[str, bool], Browser] = {}
+_pool_lock = asyncio.Lock()
+
+# Session launches and closes running in the background; held here so the
+# tasks aren't garbage-collected before they finish
+_background_tasks: Set[asyncio.Task] = set()
+
+# Worker threads for CPU-bound screenshot encoding, so large images don't
+# stall the event loop. Created in startup(); until then the loop's default
+# executor is used.
+_encode_executor: Optional[ThreadPoolExecutor] = None
+
+
+async def _get_browser(browser_type: str, headless: bool) -> Browser:
+    """
+    Return a pooled browser, launching it (and Playwright) on first use.
+    
+    Args:
+        browser_type: Type of browser ('chromium', 'firefox', or 'webkit')
+        headless: Whether to run browser in headless mode
+        
+    Returns:
+        A connected Browser shared by all sessions with the same settings
+    """
+    global _playwright
+    
+    browser_type = browser_type.lower()
+    if browser_type not in ("chromium", "firefox", "webkit"):
+        raise ValueError(f"Unsupported browser type: {browser_type}")
+    
+    key = (browser_type, headless)
+    async with _pool_lock:
+        if _playwright is None:
+            _playwright = await async_playwright().start()
+        
+        browser = _browsers.get(key)
+        # Relaunch if the pooled browser crashed or was closed externally
+        if browser is None or not browser.is_connected():
+            browser = await getattr(_playwright, browser_type).launch(headless=headless)
+            _browsers[key] = browser
+        return browser
+
+
+def _spawn(coro: Coroutine[Any, Any, None]) -> asyncio.Task:
+    """Run a coroutine in the background, keeping a reference until it is done."""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
+async def _close_quietly(session: Session) -> None:
+    try:
+        await _close_session_resources(session)
+    except Exception:
+        # The page or context may already be gone
+        pass
+
+
+async def startup() -> None:
+    """
+    Start session expiry, the encoder threads, Playwright and the browsers in
+    PREWARM_BROWSERS. A browser that fails to prewarm is logged and launched
+    lazily later instead of stopping the server from starting.
+    """
+    global _encode_executor
+    
+    sessions.start()
+    if _encode_executor is None:
+        _encode_executor = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="screenshot-encode")
+    for browser_type, headless in PREWARM_BROWSERS:
+        try:
+            await _get_browser(browser_type, headless)
+        except Exception as e:
+            # Not fatal: _get_browser tries again on that browser's first
+            # session, and other browser types are unaffected
+            logger.warning("Failed to prewarm %s (headless=%s): %s", browser_type, headless, e)
+
+
+async def shutdown() -> None:
+    """Close all sessions and pooled browsers, then stop Playwright and the encoder threads."""
+    global _playwright, _encode_executor
+    
+    await sessions.stop()
+    for session_id, _ in list(sessions.items()):
+        await close_session(session_id)
+    if _background_tasks:
+        await asyncio.gather(*_background_tasks, return_exceptions=True)
+    
+    async with _pool_lock:
+        for browser in _browsers.values():
+            await browser.close()
+        _browsers.clear()
+        if _playwright is not None:
+            await _playwright.stop()
+            _playwright = None
+    
+    if _encode_executor is not None:
+        _encode_executor.shutdown(wait=False)
+        _encode_executor = None
+
+
+def _track_navigation(session: Session, page: Page) -> None:
+    """
+    Keep session.navigating up to date from the page's events.
+    
+    A navigation started by an action (e.g. clicking a link) is only
+    visible as a pending request until the new document commits; until
+    then the old document still reports readyState "complete".
+    
+    Subscribing to "request" makes Playwright forward an event for every
+    request the page makes, subresources included, so this is only done
+    for sessions that poll /session/ready (see is_page_idle).
+    
+    Args:
+        session: Session whose navigating flag to maintain
+        page: The session's page
+    """
+    def is_main_navigation(request) -> bool:
+        return request.is_navigation_request() and request.frame is page.main_frame
+    
+    async def settle_if_no_content(request) -> None:
+        # No Content responses leave the current document in place, so no
+        # load event follows
+        try:
+            response = await request.response()
+        except PlaywrightError:
+            return
+        if response is not None and response.status in (204, 205):
+            session.navigating = False
+    
+    def on_request(request) -> None:
+        if is_main_navigation(request):
+            session.navigating = True
+            _spawn(settle_if_no_content(request))
+    
+    def on_request_failed(request) -> None:
+        if is_main_navigation(request):
+            session.navigating = False
+    
+    def on_settled(_) -> None:
+        session.navigating = False
+    
+    page.on("request", on_request)
+    page.on("requestfailed", on_request_failed)
+    page.on("load", on_settled)
+    page.on("download", on_settled)
+    session.navigation_tracked = True
+
+
+async def _launch_session(session: Session, headless: bool, context_options: Dict[str, Any]) -> None:
+    """
+    Create the browser context and page for a session started by start_session.
+    
+    Always sets session.ready; on failure session.error holds the reason
+    and the session stays unusable.
+    """
+    context = None
+    try:
+        browser = await _get_browser(session.browser_type, headless)
+        context = await browser.new_context(**context_options)
+        page = await context.new_page()
+        session.browser = browser
+        session.context = context
+        session.page = page
+    except Exception as e:
+        session.error = f"Failed to start session: {str(e)}"
+        if context is not None:
+            try:
+                await context.close()
+            except Exception:
+                pass
+    finally:
+        session.ready.set()
+
+
+async def _wait_ready(session: Session) -> None:
+    """Wait for a session's background launch, raising if it failed."""
+    await session.ready.wait()
+    if session.error is not None:
+        raise Exception(session.error)
 
 
 async def start_session(browser_type: str, headless: bool = True, **kwargs) -> str:
     """
     Start a new browser session.
     
+    The browser itself comes from the shared pool; each session gets its
+    own isolated browser context and page. These are created in the
+    background, so the session ID is returned right away; actions on the
+    session wait for the launch and fail if it did not succeed.
+    
     Args:
         browser_type: Type of browser ('chromium', 'firefox', or 'webkit')
         headless: Whether to run browser in headless mode
@@ -21,77 +386,206 @@ async def start_session(browser_type: str, headless: bool = True, **kwargs) -> s
     Returns:
         session_id: Unique identifier for the session
     """
-    session_id = str(uuid.uuid4())
+    browser_type = browser_type.lower()
+    if browser_type not in ("chromium", "firefox", "webkit"):
+        raise Exception(f"Failed to start session: Unsupported browser type: {browser_type}")
     
-    # Initialize playwright
-    playwright = await async_playwright().start()
+    session_id = str(uuid.uuid4())
     
     # Extract viewport settings
     viewport = kwargs.pop('viewport', None)
     
-    # Launch browser with only the headless option
-    try:
-        if browser_type.lower() == "chromium":
-            browser = await playwright.chromium.launch(headless=headless)
-        elif browser_type.lower() == "firefox":
-            browser = await playwright.firefox.launch(headless=headless)
-        elif browser_type.lower() == "webkit":
-            browser = await playwright.webkit.launch(headless=headless)
-        else:
-            await playwright.stop()
-            raise ValueError(f"Unsupported browser type: {browser_type}")
-        
-        # Create a new browser context with viewport if specified
-        context_options = {}
-        if viewport:
-            context_options['viewport'] = viewport
-        
-        context = await browser.new_context(**context_options)
-        page = await context.new_page()
-        
-        # Store session information
-        sessions[session_id] = {
-            "playwright": playwright,
-            "browser": browser,
-            "context": context,
-            "page": page
-        }
-        
-        return session_id
-    except Exception as e:
-        # Make sure to clean up if there's an error
-        await playwright.stop()
-        raise Exception(f"Failed to start session: {str(e)}")
+    # Create a new browser context with viewport if specified
+    context_options = {}
+    if viewport:
+        context_options['viewport'] = viewport
+    
+    # Store session information; the launch fills in browser/context/page
+    session = Session(browser_type=browser_type)
+    await sessions.put(session_id, session)
+    _spawn(_launch_session(session, headless, context_options))
+    
+    return session_id
 
 
 async def close_session(session_id: str) -> bool:
     """
     Close a browser session.
     
+    The session is unregistered immediately and its page and context are
+    closed in the background. The pooled browser is left running for other
+    sessions.
+    
     Args:
         session_id: ID of the session to close
         
     Returns:
-        True if session was closed successfully, False otherwise
+        True if the session existed and is being closed, False otherwise
     """
-    if session_id not in sessions:
+    # Remove the session first so concurrent closes can't close it twice
+    session = await sessions.pop(session_id)
+    if session is None:
         return False
     
-    session = sessions[session_id]
+    _spawn(_close_quietly(session))
     
-    # Close page, context, browser, and stop playwright
-    await session["page"].close()
-    await session["context"].close()
-    await session["browser"].close()
-    await session["playwright"].stop()
+    return True
+
+
+async def is_page_idle(session_id: str) -> bool:
+    """
+    Check whether a session is ready and its page has finished loading.
     
-    # Remove session from dictionary
-    del sessions[session_id]
+    Args:
+        session_id: ID of the session to check
+        
+    Returns:
+        True once the session has launched, no navigation is pending and
+        document.readyState is "complete", False while it is still
+        starting or navigating
+    """
+    session = await sessions.get(session_id)
+    if session is None:
+        raise ValueError(f"Session not found: {session_id}")
     
-    return True
+    if not session.ready.is_set():
+        return False
+    if session.error is not None:
+        raise Exception(session.error)
+    # Navigations are only tracked from the first probe on, so sessions that
+    # never poll don't pay for per-request events
+    if not session.navigation_tracked:
+        _track_navigation(session, session.page)
+    # The old document reads "complete" until a started navigation commits
+    if session.navigating:
+        return False
+    
+    try:
+        return await session.page.evaluate("document.readyState") == "complete"
+    except Exception:
+        # The execution context is torn down while a navigation is in flight
+        return False
+
+
+async def _hover(element: Locator, kwargs: Dict[str, Any]) -> None:
+    # Wait for element to be visible before hovering
+    await element.wait_for(state="visible", timeout=5000)
+    await element.hover(**kwargs)
+
+
+# Element actions, keyed by action name. Each entry receives the resolved
+# locator and the action's own kwargs dict (safe to pop from), and pulls out
+# its positional argument before forwarding the rest.
+_ACTION_TABLE: Dict[str, Callable[[Locator, Dict[str, Any]], Awaitable[Any]]] = {
+    "click": lambda el, kw: el.click(**kw),
+    "fill": lambda el, kw: el.fill(kw.pop("value", ""), **kw),
+    "type": lambda el, kw: el.type(kw.pop("text", ""), **kw),
+    "hover": _hover,
+    "focus": lambda el, kw: el.focus(**kw),
+    "press": lambda el, kw: el.press(kw.pop("key", ""), **kw),
+    "check": lambda el, kw: el.check(**kw),
+    "uncheck": lambda el, kw: el.uncheck(**kw),
+    "select_option": lambda el, kw: el.select_option(kw.pop("values", []), **kw),
+    "upload_file": lambda el, kw: el.set_input_files(kw.pop("files", []), **kw),
+    "dblclick": lambda el, kw: el.dblclick(**kw),
+}
+
 
+# How long (in ms) each structured-locator strategy may take to match
+LOCATOR_PROBE_TIMEOUT = 500
 
-async def execute_action(session_id: str, action: str, locator: Any = None, **kwargs) -> Tuple[bool, Optional[bytes]]:
+
+async def _is_attached(element: Locator) -> bool:
+    """Wait briefly for the locator to match something in the DOM."""
+    try:
+        await element.first.wait_for(state="attached", timeout=LOCATOR_PROBE_TIMEOUT)
+        return True
+    except PlaywrightError:
+        # A timeout, or a selector Playwright can't parse; either way this
+        # strategy doesn't match
+        return False
+
+
+def _css_string(value: str) -> str:
+    """Quote a value as a CSS string, for attribute and :has-text() selectors."""
+    escaped = []
+    for char in value:
+        if char in '"\\':
+            escaped.append("\\" + char)
+        elif char < " " or char == "\x7f":
+            escaped.append(f"\\{ord(char):x} ")
+        else:
+            escaped.append(char)
+    return '"' + "".join(escaped) + '"'
+
+
+@lru_cache(maxsize=4096)
+def _role_selectors(role: str, name: str) -> Tuple[str, str, str]:
+    """Fallback selectors for a structured locator, built once per (role, name)."""
+    # text= takes the rest of the selector literally, so only the quoted
+    # forms need escaping
+    quoted = _css_string(name)
+    return (f'text={name}', f'[aria-label={quoted}]', f'{role}:has-text({quoted})')
+
+
+# Number of strategies for resolving a structured locator: get_by_role,
+# then each of the _role_selectors fallbacks
+ROLE_STRATEGY_COUNT = 4
+
+
+def _role_strategy(page: Page, role: str, name: str, index: int) -> Locator:
+    """Build the locator for the index-th structured-locator strategy."""
+    if index == 0:
+        return page.get_by_role(role, name=name)
+    return page.locator(_role_selectors(role, name)[index - 1])
+
+
+async def _resolve_structured_locator(session: Session, page: Page,
+                                      role: str, name: str) -> Optional[Locator]:
+    """
+    Resolve a structured locator to the first strategy that matches an element.
+    
+    The winning strategy is remembered per (url, role, name) in the session's
+    locator_cache, so repeated steps go straight to it instead of probing
+    the earlier strategies again.
+    
+    Returns:
+        The matching Locator, or None if no strategy matches
+    """
+    cache = session.locator_cache
+    key = (page.url, role, name)
+    
+    cached = cache.get(key)
+    if cached is not None:
+        element = _role_strategy(page, role, name, cached)
+        if await _is_attached(element):
+            return element
+        # The page changed under us; probe again from the start
+        del cache[key]
+    
+    for index in range(ROLE_STRATEGY_COUNT):
+        if index == cached:
+            continue
+        element = _role_strategy(page, role, name, index)
+        if await _is_attached(element):
+            cache[key] = index
+            return element
+    return None
+
+
+async def _screenshot(page: Page, image_format: str = "jpeg", enabled: bool = True) -> bytes:
+    """Capture the current viewport; JPEG is much cheaper to encode than PNG."""
+    if not enabled:
+        # Caller opted out; skip the CDP round-trip entirely
+        return b""
+    if image_format == "png":
+        return await page.screenshot(type="png")
+    return await page.screenshot(type="jpeg", quality=SCREENSHOT_QUALITY)
+
+
+async def execute_action(session_id: str, action: str, locator: Any = None,
+                         capture_on_miss: bool = False, image_format: str = "jpeg",
+                         take_screenshot: bool = True, **kwargs) -> Tuple[bool, Optional[bytes]]:
     """
     Execute a Playwright action on a browser session.
     
@@ -99,27 +593,38 @@ async def execute_action(session_id: str, action: str, locator: Any = None, **kw
         session_id: ID of the session to use
         action: Name of the Playwright action to execute
         locator: Element locator (string or structured format), optional for page-level actions
+        capture_on_miss: Whether to take a screenshot when a structured locator matches no element
+        image_format: Screenshot format, 'jpeg' (default) or 'png'
+        take_screenshot: Whether to take a screenshot at all; if False the
+            screenshot is returned as empty bytes
         kwargs: Additional parameters for the action
         
     Returns:
-        Tuple containing (success, screenshot)
+        Tuple containing (success, screenshot). The screenshot is None when
+        a structured locator matched nothing and capture_on_miss is False.
     """
-    if session_id not in sessions:
+    session = await sessions.get(session_id)
+    if session is None:
         raise ValueError(f"Session not found: {session_id}")
     
-    session = sessions[session_id]
-    page = session["page"]
+    await _wait_ready(session)
+    page = session.page
     
     # Handle page-level actions (like goto) that don't require a locator
     if action == "goto":
+        # Resolved locators belong to the page being left
+        session.locator_cache.clear()
         try:
-            await page.goto(kwargs.get("url", ""), **{k: v for k, v in kwargs.items() if k != "url"})
-            screenshot = await page.screenshot()
-            return True, screenshot
-        except Exception as e:
-            return False, await page.screenshot()
+            await page.goto(kwargs.pop("url", ""), **kwargs)
+            success = True
+        except Exception:
+            success = False
+        return success, await _screenshot(page, image_format, take_screenshot)
     
     # For all other actions that require a locator
+    perform = _ACTION_TABLE.get(action)
+    if perform is None:
+        raise ValueError(f"Unsupported action: {action}")
     if locator is None:
         raise ValueError(f"Locator is required for action: {action}")
     
@@ -127,71 +632,71 @@ async def execute_action(session_id: str, action: str, locator: Any = None, **kw
     element = None
     try:
         if isinstance(locator, str):
-            # String locator (CSS, XPath, etc.)
+            # String locator (CSS, XPath, etc.); the action itself
+            # auto-waits for the element and fails if it never appears
             element = page.locator(locator)
         elif isinstance(locator, dict) and "role" in locator and "name" in locator:
-            # Try different locating strategies
-            try:
-                # First try get_by_role
-                element = page.get_by_role(locator["role"], name=locator["name"])
-            except Exception:
-                # Try by using text selector
-                element = page.locator(f'text={locator["name"]}')
-                
-                # If that fails, try by aria-label
-                if not await element.count():
-                    element = page.locator(f'[aria-label="{locator["name"]}"]')
-                    
-                # If all fails, try a more generic approach
-                if not await element.count():
-                    element = page.locator(f'{locator["role"]}:has-text("{locator["name"]}")')
+            element = await _resolve_structured_locator(session, page, locator["role"], locator["name"])
         else:
             raise ValueError(f"Invalid locator format: {locator}")
     except Exception as e:
         # In case of any locator error, return screenshot with error
         raise ValueError(f"Failed to locate element: {str(e)}")
     
-    # Verify that the element exists before taking action
-    if await element.count() == 0:
-        screenshot = await page.screenshot()
-        return False, screenshot
+    # No structured-locator strategy matched
+    if element is None:
+        return False, (await _screenshot(page, image_format, take_screenshot) if capture_on_miss else None)
     
     # Execute the requested action
     try:
-        if action == "click":
-            await element.click(**kwargs)
-        elif action == "fill":
-            await element.fill(kwargs.get("value", ""), **{k: v for k, v in kwargs.items() if k != "value"})
-        elif action == "type":
-            await element.type(kwargs.get("text", ""), **{k: v for k, v in kwargs.items() if k != "text"})
-        elif action == "hover":
-            # Wait for element to be visible before hovering
-            await element.wait_for(state="visible", timeout=5000)
-            await element.hover(**kwargs)
-        elif action == "focus":
-            await element.focus(**kwargs)
-        elif action == "press":
-            await element.press(kwargs.get("key", ""), **{k: v for k, v in kwargs.items() if k != "key"})
-        elif action == "check":
-            await element.check(**kwargs)
-        elif action == "uncheck":
-            await element.uncheck(**kwargs)
-        elif action == "select_option":
-            await element.select_option(kwargs.get("values", []), **{k: v for k, v in kwargs.items() if k != "values"})
-        elif action == "upload_file":
-            await element.set_input_files(kwargs.get("files", []), **{k: v for k, v in kwargs.items() if k != "files"})
-        elif action == "dblclick":
-            await element.dblclick(**kwargs)
-        else:
-            raise ValueError(f"Unsupported action: {action}")
+        await perform(element, kwargs)
+        success = True
+    except Exception:
+        success = False
+    
+    # Capture a single screenshot whether or not the action succeeded
+    return success, await _screenshot(page, image_format, take_screenshot)
+
+
+async def _b64_async(screenshot: bytes) -> str:
+    """Base64-encode on the encoder thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_encode_executor, pybase64.b64encode_as_string, screenshot)
+
+
+async def encode_screenshot(session_id: str, screenshot: Optional[bytes]) -> Optional[str]:
+    """
+    Base64-encode a screenshot, reusing the session's cached encoding when
+    the same image bytes were produced before. Encoding runs off the event
+    loop.
+    
+    Args:
+        session_id: ID of the session the screenshot was taken in
+        screenshot: Raw image bytes, or None if no screenshot was taken
         
-        # Capture screenshot
-        screenshot = await page.screenshot()
-        return True, screenshot
+    Returns:
+        Base64 string of the screenshot, or None if screenshot is None
+    """
+    if screenshot is None:
+        return None
+    if not screenshot:
+        return ""
     
-    except Exception as e:
-        # Return error with screenshot
-        return False, await page.screenshot()
+    session = sessions.peek(session_id)
+    if session is None:
+        return await _b64_async(screenshot)
+    
+    # Content-addressed, so entries never need invalidating; the dict is
+    # kept in LRU order by re-inserting on every hit.
+    cache = session.b64_cache
+    key = (len(screenshot), xxhash.xxh3_64_intdigest(screenshot))
+    encoded = cache.pop(key, None)
+    if encoded is None:
+        encoded = await _b64_async(screenshot)
+        if len(cache) >= B64_CACHE_SIZE:
+            del cache[next(iter(cache))]
+    cache[key] = encoded
+    return encoded
 
 
 def get_active_sessions() -> Dict[str, str]:
@@ -203,5 +708,5 @@ def get_active_sessions() -> Dict[str, str]:
     """
     result = {}
     for session_id, session in sessions.items():
-        result[session_id] = session["browser"].browser_type.name
+        result[session_id] = session.browser_type
     return result 
\ No newline at end of file
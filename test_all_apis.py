@@ -1,17 +1,134 @@
-import requests
-import base64
-import json
+import aiohttp
+import asyncio
+import atexit
+import binascii
+import io
+import itertools
+import orjson
+import sys
 import time
 import os
-from typing import Dict, Any, Optional
+import tarfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
 
 
 BASE_URL = "http://localhost:8000"
+
+# Endpoint URLs, built once instead of on every call
+URL_START = f"{BASE_URL}/session/start"
+URL_READY = f"{BASE_URL}/session/ready"
+URL_CLOSE = f"{BASE_URL}/session/close"
+URL_GOTO = f"{BASE_URL}/action/goto"
+URL_CLICK = f"{BASE_URL}/action/click"
+URL_HOVER = f"{BASE_URL}/action/hover"
+URL_FILL = f"{BASE_URL}/action/fill"
+URL_TYPE = f"{BASE_URL}/action/type"
+URL_PRESS = f"{BASE_URL}/action/press"
+URL_BATCH = f"{BASE_URL}/action/batch"
+URLS = {
+    "goto": URL_GOTO,
+    "click": URL_CLICK,
+    "hover": URL_HOVER,
+    "fill": URL_FILL,
+    "type": URL_TYPE,
+    "press": URL_PRESS,
+}
+
+# Action tests as (action_name, op, payload without sessionId). action_name
+# labels the output and screenshot; op picks the endpoint.
+ACTIONS = [
+    ("goto", "goto", {"url": "https://playwright.dev"}),
+    ("click_string", "click", {"locator": "text=Get Started", "force": False, "button": "left"}),
+    ("click_structured", "click", {"locator": {"role": "link", "name": "Docs"}, "force": False}),
+    ("hover", "hover", {"locator": "text=API", "force": False}),
+]
+
+# Form steps on a page with a search box, run together through /action/batch
+SEARCH_BOX = "textarea[name='q']"
+FORM_ACTIONS = [
+    ("goto_google", "goto", {"url": "https://www.google.com"}),
+    ("fill", "fill", {"locator": SEARCH_BOX, "value": "Playwright testing", "force": False}),
+    ("clear_field", "fill", {"locator": SEARCH_BOX, "value": "", "force": False}),
+    ("type", "type", {"locator": SEARCH_BOX, "text": "Playwright API", "delay": 100}),
+    ("press", "press", {"locator": SEARCH_BOX, "key": "Enter"}),
+]
+
 session_id = None
 
-# Create screenshots directory if it doesn't exist
+# Request/response bodies are only printed with TEST_VERBOSE=1
+VERBOSE = os.environ.get("TEST_VERBOSE") == "1"
+
+# CI=1 prints nothing for successful actions; failures are still reported
+QUIET = os.environ.get("CI") == "1"
+
+# Indented JSON is only worth its cost when a person is reading the output
+IS_TTY = sys.stdout.isatty()
+
+# Base64 characters decoded per write; a multiple of 4 so each chunk
+# decodes on its own
+B64_CHUNK = 76 * 1024
+
+# File buffer large enough that a chunked screenshot write reaches the
+# OS as a single write() call
+WRITE_BUFFER = 1 << 20
+
+# Payloads are pre-serialized with orjson, so the content type is set by hand
+HEADERS = {"Content-Type": "application/json"}
+
+# Timeout (in seconds) for each API call
+REQUEST_TIMEOUT = 60
+
+# Shared HTTP session so every API call reuses a keep-alive connection;
+# created by run_all_tests() since aiohttp needs a running event loop
+SESSION: Optional[aiohttp.ClientSession] = None
+
+# Fixed wait (in seconds) between steps when the server has no ready probe
+FALLBACK_WAIT = 3
+
+# Background writer for screenshots; drained before the interpreter exits.
+# A single worker keeps archive writes ordered and never concurrent.
+SCREENSHOT_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="screenshot-writer")
+atexit.register(SCREENSHOT_EXECUTOR.shutdown, wait=True)
+
+# Tar archive collecting every screenshot of the current run_all_tests();
+# when None, screenshots are written as individual files
+ARCHIVE: Optional[tarfile.TarFile] = None
+
+# Archive write failures, reported once the run ends; printing them from the
+# writer thread would split up the per-helper output blocks
+SAVE_ERRORS: List[str] = []
+
 SCREENSHOTS_DIR = "screenshots"
-os.makedirs(SCREENSHOTS_DIR, exist_ok=True)
+
+# The server sends JPEG unless a request sets image_format="png", which
+# these tests never do
+SCREENSHOT_EXT = "jpg"
+
+# Screenshot names share one run timestamp and a per-run sequence number,
+# so they are unique even when several land in the same second
+RUN_TS = time.strftime('%Y%m%d_%H%M%S')
+COUNTER = itertools.count()
+
+# Each run gets its own directory so SCREENSHOTS_DIR gains one entry per run
+# rather than one per screenshot
+RUN_DIR = os.path.join(SCREENSHOTS_DIR, RUN_TS)
+if not os.path.isdir(RUN_DIR):
+    os.makedirs(RUN_DIR, exist_ok=True)
+
+
+# Per-thread buffer that archive members are decoded into. It is rewound
+# rather than truncated between screenshots, so its memory is reused
+_scratch = threading.local()
+
+
+def write_base64(f, data: str):
+    """Decode base64 text straight into a file, one chunk at a time"""
+    # a2b_base64 takes ASCII str directly, so the whole text is never
+    # copied into a bytes object first
+    for start in range(0, len(data), B64_CHUNK):
+        f.write(binascii.a2b_base64(data[start:start + B64_CHUNK]))
 
 
 def save_screenshot(screenshot_base64: str, action_name: str, success: bool):
@@ -20,49 +137,135 @@ def save_screenshot(screenshot_base64: str, action_name: str, success: bool):
         return
     
     status = "success" if success else "error"
-    filename = f"{SCREENSHOTS_DIR}/{time.strftime('%Y%m%d_%H%M%S')}_{action_name}_{status}.png"
+    name = f"{RUN_TS}_{next(COUNTER):03d}_{action_name}_{status}.{SCREENSHOT_EXT}"
     
+    # Write in the background so the next API call isn't held up by disk I/O
+    if ARCHIVE is not None:
+        SCREENSHOT_EXECUTOR.submit(_add_to_archive, ARCHIVE, name, screenshot_base64)
+    else:
+        SCREENSHOT_EXECUTOR.submit(_write_image, os.path.join(RUN_DIR, name), screenshot_base64)
+
+
+def _add_to_archive(archive: tarfile.TarFile, name: str, screenshot_base64: str):
+    """Decode one screenshot into the run's tar archive; runs on SCREENSHOT_EXECUTOR"""
     try:
-        with open(filename, "wb") as f:
-            f.write(base64.b64decode(screenshot_base64))
-        print(f"Screenshot saved to {filename}")
+        scratch = getattr(_scratch, "buffer", None)
+        if scratch is None:
+            scratch = _scratch.buffer = io.BytesIO()
+        scratch.seek(0)
+        write_base64(scratch, screenshot_base64)
+        
+        info = tarfile.TarInfo(name)
+        # Bytes past this from an earlier, larger screenshot are never read
+        info.size = scratch.tell()
+        info.mtime = int(time.time())
+        scratch.seek(0)
+        archive.addfile(info, scratch)
+    except Exception as e:
+        SAVE_ERRORS.append(f"{name}: {str(e)}")
+
+
+def _write_image(filename: str, screenshot_base64: str):
+    """
+    Decode and write one screenshot; runs on SCREENSHOT_EXECUTOR.
+    
+    Only used outside run_all_tests(), so there is no buffered helper output
+    for an error message to interleave with.
+    """
+    try:
+        with open(filename, "wb", buffering=WRITE_BUFFER) as f:
+            write_base64(f, screenshot_base64)
     except Exception as e:
         print(f"Error saving screenshot: {str(e)}")
 
 
-def print_response(response, action_name="unknown"):
-    """Print response in a readable format and save screenshot if present"""
+def flush_output(buf: io.StringIO, success: bool):
+    """Write a helper's buffered output; in QUIET mode successes print nothing"""
+    if not (QUIET and success):
+        sys.stdout.write(buf.getvalue())
+
+
+def format_json(data) -> str:
+    """Pretty-print JSON for a terminal; use the compact form otherwise"""
+    if IS_TTY:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return orjson.dumps(data).decode()
+
+
+async def print_response(response, action_name="unknown", buf=None):
+    """
+    Print response in a readable format and save screenshot if present.
+    
+    Output goes to buf when given, so the caller can write it out in one go.
+    """
     try:
-        data = response.json()
+        data = orjson.loads(await response.read())
         
         # Save screenshot if it exists in the response
-        if "screenshot" in data:
+        has_screenshot = "screenshot" in data
+        if has_screenshot:
             success = data.get("status") == "success"
             save_screenshot(data["screenshot"], action_name, success)
             
-            # Don't print the screenshot data to keep the output clean
-            data_to_print = data.copy()
-            data_to_print["screenshot"] = "... base64 data ..."
-        else:
-            data_to_print = data
-            
-        print(f"Status: {response.status_code}")
-        print(f"Response: {json.dumps(data_to_print, indent=2)}")
-        print("=" * 50)
+        print(f"Status: {response.status}", file=buf)
+        if VERBOSE:
+            if has_screenshot:
+                # Don't print the screenshot data to keep the output clean;
+                # swap it out for printing rather than copying the dict
+                screenshot = data["screenshot"]
+                data["screenshot"] = "... base64 data ..."
+                print(f"Response: {format_json(data)}", file=buf)
+                data["screenshot"] = screenshot
+            else:
+                print(f"Response: {format_json(data)}", file=buf)
+        print("=" * 50, file=buf)
         
         return data
-    except:
-        print(f"Status: {response.status_code}")
-        print(f"Response: {response.text}")
-        print("=" * 50)
+    except Exception:
+        print(f"Status: {response.status}", file=buf)
+        print(f"Response: {await response.text()}", file=buf)
+        print("=" * 50, file=buf)
         return None
 
 
-def test_start_session() -> Optional[str]:
+async def poll_ready(session_id: str, interval: float = 0.05, timeout: float = 5) -> bool:
+    """
+    Wait until the session's page is idle by polling /session/ready.
+    
+    Falls back to a single fixed sleep if the server has no ready probe,
+    and gives up at once if the probe reports the session as gone.
+    """
+    url = URL_READY
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            response = await SESSION.get(url, params={"sessionId": session_id})
+            body = await response.read()
+            if response.status == 200:
+                return True
+            if response.status == 404:
+                try:
+                    detail = orjson.loads(body).get("detail", "")
+                except (orjson.JSONDecodeError, AttributeError):
+                    detail = ""
+                if isinstance(detail, str) and detail.startswith("Session not found"):
+                    return False
+                # No /session/ready route on this server
+                await asyncio.sleep(FALLBACK_WAIT)
+                return False
+        except aiohttp.ClientError:
+            pass
+        if time.monotonic() >= deadline:
+            return False
+        await asyncio.sleep(interval)
+
+
+async def test_start_session() -> Optional[str]:
     """Test the start_session endpoint"""
-    print("\n\n=== Testing /session/start ===")
+    buf = io.StringIO()
+    print("\n\n=== Testing /session/start ===", file=buf)
     
-    url = f"{BASE_URL}/session/start"
+    url = URL_START
     payload = {
         "browser": "chromium",
         "headless": True,
@@ -70,219 +273,140 @@ def test_start_session() -> Optional[str]:
         "viewport_height": 720
     }
     
-    print(f"Request: {json.dumps(payload, indent=2)}")
+    if VERBOSE:
+        print(f"Request: {format_json(payload)}", file=buf)
     try:
-        response = requests.post(url, json=payload)
-        data = print_response(response, "session_start")
+        response = await SESSION.post(url, data=orjson.dumps(payload), headers=HEADERS)
+        data = await print_response(response, "session_start", buf)
         if data and "sessionId" in data:
             return data["sessionId"]
         return None
     except Exception as e:
-        print(f"Error: {str(e)}")
+        print(f"Error: {str(e)}", file=buf)
         return None
+    finally:
+        sys.stdout.write(buf.getvalue())
 
 
-def test_goto(session_id: str) -> bool:
-    """Test the goto endpoint"""
-    print("\n\n=== Testing /action/goto ===")
-    
-    url = f"{BASE_URL}/action/goto"
-    payload = {
-        "sessionId": session_id,
-        "url": "https://playwright.dev"
-    }
-    
-    print(f"Request: {json.dumps(payload, indent=2)}")
-    try:
-        response = requests.post(url, json=payload)
-        data = print_response(response, "goto")
-        return response.status_code == 200 and data.get("status") == "success"
-    except Exception as e:
-        print(f"Error: {str(e)}")
-        return False
-
-
-def test_click(session_id: str) -> bool:
-    """Test the click endpoint with a string locator"""
-    print("\n\n=== Testing /action/click with string locator ===")
-    
-    url = f"{BASE_URL}/action/click"
-    payload = {
-        "sessionId": session_id,
-        "locator": "text=Get Started",
-        "force": False,
-        "button": "left"
-    }
-    
-    print(f"Request: {json.dumps(payload, indent=2)}")
-    try:
-        response = requests.post(url, json=payload)
-        data = print_response(response, "click_string")
-        return response.status_code == 200 and data.get("status") == "success"
-    except Exception as e:
-        print(f"Error: {str(e)}")
-        return False
-
-
-def test_click_structured(session_id: str) -> bool:
-    """Test the click endpoint with a structured locator"""
-    print("\n\n=== Testing /action/click with structured locator ===")
-    
-    url = f"{BASE_URL}/action/click"
-    payload = {
-        "sessionId": session_id,
-        "locator": {
-            "role": "link",
-            "name": "Docs"
-        },
-        "force": False
-    }
-    
-    print(f"Request: {json.dumps(payload, indent=2)}")
-    try:
-        response = requests.post(url, json=payload)
-        data = print_response(response, "click_structured")
-        return response.status_code == 200 and data.get("status") == "success"
-    except Exception as e:
-        print(f"Error: {str(e)}")
-        return False
-
-
-def test_hover(session_id: str) -> bool:
-    """Test the hover endpoint"""
-    print("\n\n=== Testing /action/hover ===")
+async def call_action(session_id: str, action_name: str, op: str, extra: Dict[str, Any]) -> bool:
+    """Call one /action/<op> endpoint and report whether it succeeded"""
+    buf = io.StringIO()
+    print(f"\n\n=== Testing /action/{op} ({action_name}) ===", file=buf)
     
-    url = f"{BASE_URL}/action/hover"
-    payload = {
-        "sessionId": session_id,
-        "locator": "text=API",
-        "force": False
-    }
+    payload = {"sessionId": session_id, **extra}
+    success = False
     
-    print(f"Request: {json.dumps(payload, indent=2)}")
+    if VERBOSE:
+        print(f"Request: {format_json(payload)}", file=buf)
     try:
-        response = requests.post(url, json=payload)
-        data = print_response(response, "hover")
-        return response.status_code == 200 and data.get("status") == "success"
+        response = await SESSION.post(URLS[op], data=orjson.dumps(payload), headers=HEADERS)
+        data = await print_response(response, action_name, buf)
+        success = response.status == 200 and data is not None and data.get("status") == "success"
+        return success
     except Exception as e:
-        print(f"Error: {str(e)}")
+        print(f"Error: {str(e)}", file=buf)
         return False
+    finally:
+        flush_output(buf, success)
 
 
-def test_fill(session_id: str) -> bool:
-    """Test the fill endpoint"""
-    print("\n\n=== Testing /action/fill ===")
+async def run_actions(session_id: str, actions: List[Dict], names: List[str],
+                      buf: Optional[io.StringIO] = None) -> Optional[List[Dict]]:
+    """
+    Run several actions in one round trip through /action/batch.
     
-    # First navigate to a page with a search box
-    goto_url = f"{BASE_URL}/action/goto"
-    goto_payload = {
-        "sessionId": session_id,
-        "url": "https://www.google.com"
-    }
-    try:
-        goto_response = requests.post(goto_url, json=goto_payload)
-        print_response(goto_response, "goto_google")
-        time.sleep(2)  # Wait for navigation to complete
-        
-        # Now test the fill action
-        url = f"{BASE_URL}/action/fill"
-        payload = {
-            "sessionId": session_id,
-            "locator": "textarea[name='q']",
-            "value": "Playwright testing",
-            "force": False
-        }
-        
-        print(f"Request: {json.dumps(payload, indent=2)}")
-        response = requests.post(url, json=payload)
-        data = print_response(response, "fill")
-        return response.status_code == 200 and data.get("status") == "success"
-    except Exception as e:
-        print(f"Error: {str(e)}")
-        return False
-
-
-def test_type(session_id: str) -> bool:
-    """Test the type endpoint"""
-    print("\n\n=== Testing /action/type ===")
+    Saves each step's screenshot under the matching entry of names and
+    returns the per-step results, or None if the request failed. Output
+    goes to buf when given; otherwise it is written out once on return.
+    """
+    owns_buf = buf is None
+    if owns_buf:
+        buf = io.StringIO()
+    all_succeeded = False
+    url = URL_BATCH
+    payload = {"sessionId": session_id, "actions": actions}
     
+    if VERBOSE:
+        print(f"Request: {format_json(payload)}", file=buf)
     try:
-        # Clear the search box first
-        fill_url = f"{BASE_URL}/action/fill"
-        fill_payload = {
-            "sessionId": session_id,
-            "locator": "textarea[name='q']",
-            "value": "",
-            "force": False
-        }
-        fill_response = requests.post(fill_url, json=fill_payload)
-        print_response(fill_response, "clear_field")
-        time.sleep(1)  # Wait for action to complete
+        response = await SESSION.post(url, data=orjson.dumps(payload), headers=HEADERS)
+        body = await response.read()
+        print(f"Status: {response.status}", file=buf)
+        if response.status != 200:
+            print(f"Response: {body.decode(errors='replace')}", file=buf)
+            print("=" * 50, file=buf)
+            return None
         
-        # Now test the type action
-        url = f"{BASE_URL}/action/type"
-        payload = {
-            "sessionId": session_id,
-            "locator": "textarea[name='q']",
-            "text": "Playwright API",
-            "delay": 100
-        }
-        
-        print(f"Request: {json.dumps(payload, indent=2)}")
-        response = requests.post(url, json=payload)
-        data = print_response(response, "type")
-        return response.status_code == 200 and data.get("status") == "success"
+        results = orjson.loads(body)["results"]
+        for name, result in zip(names, results):
+            success = result.get("status") == "success"
+            if "screenshot" in result:
+                save_screenshot(result["screenshot"], name, success)
+            if QUIET and success:
+                continue
+            print(f"  {name}: {result.get('status')}" + ("" if success else f" ({result.get('error')})"), file=buf)
+            if VERBOSE:
+                # Swap the screenshot out for printing, as print_response does
+                screenshot = result.get("screenshot")
+                result["screenshot"] = "... base64 data ..."
+                print(f"Response: {format_json(result)}", file=buf)
+                result["screenshot"] = screenshot
+        print("=" * 50, file=buf)
+        all_succeeded = len(results) == len(actions) and all(
+            result.get("status") == "success" for result in results
+        )
+        return results
     except Exception as e:
-        print(f"Error: {str(e)}")
-        return False
+        print(f"Error: {str(e)}", file=buf)
+        return None
+    finally:
+        if owns_buf:
+            flush_output(buf, all_succeeded)
 
 
-def test_press(session_id: str) -> bool:
-    """Test the press endpoint"""
-    print("\n\n=== Testing /action/press ===")
+async def test_form_pipeline(session_id: str) -> bool:
+    """Test the FORM_ACTIONS steps as one /action/batch call"""
+    buf = io.StringIO()
+    print("\n\n=== Testing /action/batch (form pipeline) ===", file=buf)
     
-    url = f"{BASE_URL}/action/press"
-    payload = {
-        "sessionId": session_id,
-        "locator": "textarea[name='q']",
-        "key": "Enter"
-    }
+    actions = [{"op": op, **extra} for _, op, extra in FORM_ACTIONS]
+    names = [action_name for action_name, _, _ in FORM_ACTIONS]
     
-    print(f"Request: {json.dumps(payload, indent=2)}")
-    try:
-        response = requests.post(url, json=payload)
-        data = print_response(response, "press")
-        return response.status_code == 200 and data.get("status") == "success"
-    except Exception as e:
-        print(f"Error: {str(e)}")
-        return False
+    results = await run_actions(session_id, actions, names, buf)
+    success = results is not None and len(results) == len(actions) and all(
+        result.get("status") == "success" for result in results
+    )
+    flush_output(buf, success)
+    return success
 
 
-def test_close_session(session_id: str) -> bool:
+async def test_close_session(session_id: str) -> bool:
     """Test the close_session endpoint"""
-    print("\n\n=== Testing /session/close ===")
+    buf = io.StringIO()
+    print("\n\n=== Testing /session/close ===", file=buf)
     
-    url = f"{BASE_URL}/session/close"
+    url = URL_CLOSE
     payload = {
         "sessionId": session_id
     }
     
-    print(f"Request: {json.dumps(payload, indent=2)}")
+    if VERBOSE:
+        print(f"Request: {format_json(payload)}", file=buf)
     try:
-        response = requests.post(url, json=payload)
-        data = print_response(response, "session_close")
-        return response.status_code == 200
+        response = await SESSION.post(url, data=orjson.dumps(payload), headers=HEADERS)
+        data = await print_response(response, "session_close", buf)
+        return response.status == 200
     except Exception as e:
-        print(f"Error: {str(e)}")
+        print(f"Error: {str(e)}", file=buf)
         return False
+    finally:
+        sys.stdout.write(buf.getvalue())
 
 
-def run_all_tests():
-    """Run all API tests"""
-    print("🎭 Starting Playwright Action API Tests 🎭")
-    
+async def run_one_session():
+    """Run the full action sequence against one browser session"""
     # Start a session
-    session_id = test_start_session()
+    session_id = await test_start_session()
     if not session_id:
         print("❌ Failed to start a session. Aborting tests.")
         return
@@ -291,38 +415,58 @@ def run_all_tests():
     
     try:
         # Wait for the browser to fully initialize
-        time.sleep(3)
-        
-        # Run all action tests
-        goto_success = test_goto(session_id)
-        time.sleep(3)
+        await poll_ready(session_id)
         
-        if goto_success:
-            test_click(session_id)
-            time.sleep(3)
-            
-            test_click_structured(session_id)
-            time.sleep(3)
-            
-            test_hover(session_id)
-            time.sleep(3)
-        
-        # Reset with a new page for form testing
-        test_fill(session_id)
-        time.sleep(3)
-        
-        test_type(session_id)
-        time.sleep(3)
+        # Run all action tests; the rest depend on the first goto
+        for action_name, op, extra in ACTIONS:
+            success = await call_action(session_id, action_name, op, extra)
+            await poll_ready(session_id)
+            if not success and op == "goto":
+                break
         
-        test_press(session_id)
-        time.sleep(3)
+        # Reset with a new page for form testing; the steps run as one batch
+        await test_form_pipeline(session_id)
+        await poll_ready(session_id)
     finally:
         # Always try to close the session
-        test_close_session(session_id)
+        await test_close_session(session_id)
+
+
+async def run_all_tests(sessions: int = 1):
+    """
+    Run all API tests.
+    
+    Each session runs its actions in order; with sessions > 1 the sessions
+    run concurrently over a shared connection pool.
+    """
+    global SESSION, ARCHIVE
+    
+    print("🎭 Starting Playwright Action API Tests 🎭")
+    
+    # One archive per run instead of one file per screenshot
+    archive_path = os.path.join(RUN_DIR, "screenshots.tar")
+    ARCHIVE = tarfile.open(archive_path, "w")
+    
+    # Each session issues its requests one at a time, so one keep-alive
+    # connection per session is enough and no session ever queues behind
+    # another's request on a shared connection
+    connector = aiohttp.TCPConnector(limit=sessions, limit_per_host=sessions, keepalive_timeout=60)
+    timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+    try:
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as SESSION:
+            await asyncio.gather(*[run_one_session() for _ in range(sessions)])
+    finally:
+        SESSION = None
+        # Queued behind every pending screenshot on the single writer thread
+        await asyncio.wrap_future(SCREENSHOT_EXECUTOR.submit(ARCHIVE.close))
+        ARCHIVE = None
     
     print("🎉 All tests completed!")
-    print(f"Screenshots saved in the '{SCREENSHOTS_DIR}' directory")
+    print(f"Screenshots saved in '{archive_path}'")
+    for error in SAVE_ERRORS:
+        print(f"Error saving screenshot {error}")
 
 
 if __name__ == "__main__":
-    run_all_tests() 
\ No newline at end of file
+    # TEST_SESSIONS=N runs N independent sessions in parallel
+    asyncio.run(run_all_tests(int(os.environ.get("TEST_SESSIONS", "1")))) 
\ No newline at end of file
@@ -1,33 +1,89 @@
 import requests
-import base64
-import json
+from requests.adapters import HTTPAdapter
+import binascii
+import orjson
+import os
+import sys
 import time
 from typing import Dict, Any
 
 
 BASE_URL = "http://localhost:8000"
+
+# Endpoint URLs, built once instead of on every call
+URL_START = f"{BASE_URL}/session/start"
+URL_CLOSE = f"{BASE_URL}/session/close"
+URL_GOTO = f"{BASE_URL}/action/goto"
+URL_CLICK = f"{BASE_URL}/action/click"
+URL_FILL = f"{BASE_URL}/action/fill"
+
 session_id = None
 
+# Request/response bodies are only printed with TEST_VERBOSE=1
+VERBOSE = os.environ.get("TEST_VERBOSE") == "1"
+
+# CI=1 prints nothing for successful actions; failures are still reported
+QUIET = os.environ.get("CI") == "1"
+
+# Indented JSON is only worth its cost when a person is reading the output
+IS_TTY = sys.stdout.isatty()
+
+# Base64 characters decoded per write; a multiple of 4 so each chunk
+# decodes on its own
+B64_CHUNK = 76 * 1024
+
+# File buffer large enough that a chunked screenshot write reaches the
+# OS as a single write() call
+WRITE_BUFFER = 1 << 20
+
+# Payloads are pre-serialized with orjson, so the content type is set by hand
+HEADERS = {"Content-Type": "application/json"}
+
+# Timeout (in seconds) for each API call
+REQUEST_TIMEOUT = 60
+
+# Shared HTTP session so every API call reuses a keep-alive connection
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+
+def format_json(data) -> str:
+    """Pretty-print JSON for a terminal; use the compact form otherwise"""
+    if IS_TTY:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return orjson.dumps(data).decode()
+
 
 def print_response(response):
-    """Print response in a readable format"""
+    """Print response in a readable format and return the parsed body"""
     try:
-        data = response.json()
-        # Don't print the screenshot data to keep the output clean
-        if "screenshot" in data:
-            data["screenshot"] = "... base64 data ..."
+        data = orjson.loads(response.content)
+        if QUIET and data.get("status") == "success":
+            return data
         print(f"Status: {response.status_code}")
-        print(f"Response: {json.dumps(data, indent=2)}")
+        if VERBOSE:
+            if "screenshot" in data:
+                # Don't print the screenshot data to keep the output clean;
+                # swap it out for printing rather than copying the dict, so
+                # callers still get the screenshot back
+                screenshot = data["screenshot"]
+                data["screenshot"] = "... base64 data ..."
+                print(f"Response: {format_json(data)}")
+                data["screenshot"] = screenshot
+            else:
+                print(f"Response: {format_json(data)}")
+        return data
     except:
         print(f"Status: {response.status_code}")
         print(f"Response: {response.text}")
+        return None
 
 
 def start_session() -> str:
     """Start a browser session and return the session ID"""
     global session_id
     
-    url = f"{BASE_URL}/session/start"
+    url = URL_START
     payload = {
         "browser": "chromium",
         "headless": True,
@@ -36,45 +92,42 @@ def start_session() -> str:
     }
     
     print(f"\n=== Starting session ===")
-    response = requests.post(url, json=payload)
-    print_response(response)
+    response = SESSION.post(url, data=orjson.dumps(payload), headers=HEADERS, timeout=REQUEST_TIMEOUT)
+    data = print_response(response)
     
-    data = response.json()
-    session_id = data.get("sessionId")
+    session_id = data.get("sessionId") if data else None
     return session_id
 
 
 def navigate_to_url(session_id: str, url: str):
     """Navigate to a URL"""
-    api_url = f"{BASE_URL}/action/goto"
+    api_url = URL_GOTO
     payload = {
         "sessionId": session_id,
         "url": url
     }
     
     print(f"\n=== Navigating to {url} ===")
-    response = requests.post(api_url, json=payload)
-    print_response(response)
-    return response.json()
+    response = SESSION.post(api_url, data=orjson.dumps(payload), headers=HEADERS, timeout=REQUEST_TIMEOUT)
+    return print_response(response)
 
 
 def click_element(session_id: str, locator: Dict[str, Any]):
     """Click on an element"""
-    api_url = f"{BASE_URL}/action/click"
+    api_url = URL_CLICK
     payload = {
         "sessionId": session_id,
         "locator": locator
     }
     
     print(f"\n=== Clicking on element {locator} ===")
-    response = requests.post(api_url, json=payload)
-    print_response(response)
-    return response.json()
+    response = SESSION.post(api_url, data=orjson.dumps(payload), headers=HEADERS, timeout=REQUEST_TIMEOUT)
+    return print_response(response)
 
 
 def fill_element(session_id: str, locator: Dict[str, Any], value: str):
     """Fill a form field"""
-    api_url = f"{BASE_URL}/action/fill"
+    api_url = URL_FILL
     payload = {
         "sessionId": session_id,
         "locator": locator,
@@ -82,28 +135,35 @@ def fill_element(session_id: str, locator: Dict[str, Any], value: str):
     }
     
     print(f"\n=== Filling element {locator} with '{value}' ===")
-    response = requests.post(api_url, json=payload)
-    print_response(response)
-    return response.json()
+    response = SESSION.post(api_url, data=orjson.dumps(payload), headers=HEADERS, timeout=REQUEST_TIMEOUT)
+    return print_response(response)
 
 
 def close_session(session_id: str):
     """Close the browser session"""
-    url = f"{BASE_URL}/session/close"
+    url = URL_CLOSE
     payload = {
         "sessionId": session_id
     }
     
     print(f"\n=== Closing session {session_id} ===")
-    response = requests.post(url, json=payload)
+    response = SESSION.post(url, data=orjson.dumps(payload), headers=HEADERS, timeout=REQUEST_TIMEOUT)
     print_response(response)
     return response.status_code
 
 
+def write_base64(f, data: str):
+    """Decode base64 text straight into a file, one chunk at a time"""
+    # a2b_base64 takes ASCII str directly, so the whole text is never
+    # copied into a bytes object first
+    for start in range(0, len(data), B64_CHUNK):
+        f.write(binascii.a2b_base64(data[start:start + B64_CHUNK]))
+
+
 def save_screenshot(base64_data: str, filename: str):
     """Save a base64-encoded screenshot to a file"""
-    with open(filename, "wb") as f:
-        f.write(base64.b64decode(base64_data))
+    with open(filename, "wb", buffering=WRITE_BUFFER) as f:
+        write_base64(f, base64_data)
     print(f"Screenshot saved to {filename}")
 
 
@@ -118,8 +178,8 @@ def main():
         
         # Navigate to Google
         result = navigate_to_url(session_id, "https://www.google.com")
-        if result.get("status") == "success":
-            save_screenshot(result["screenshot"], "google.png")
+        if result and result.get("status") == "success":
+            save_screenshot(result["screenshot"], "google.jpg")
         
         # Fill the search field
         fill_element(session_id, "input[name='q']", "Playwright automation")
@@ -144,4 +204,7 @@ def main():
 
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    try:
+        main()
+    finally:
+        SESSION.close() 
\ No newline at end of file